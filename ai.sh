@@ -34,6 +34,13 @@ const path = require('path');
 const PORT = process.env.PORT || 8080;
 const ROOT = __dirname;
 const OLLAMA = process.env.OLLAMA_API_URL || 'http://localhost:11434';
+// Reuse upstream sockets across bursty agent cycles instead of reconnecting per request;
+// idle pooled sockets are dropped after 300 s, and requests beyond 16 in flight queue for a free socket
+const OLLAMA_AGENT = new http.Agent({ keepAlive: true, timeout: 300000, maxSockets: 16 });
+// Upstream target is fixed for the server's lifetime: parse it once, not per request
+const OLLAMA_URL = url.parse(OLLAMA);
+const OLLAMA_PATH = OLLAMA_URL.pathname.replace(/\/$/, '');
+const OLLAMA_TARGET = Object.assign({}, OLLAMA_URL, { agent: OLLAMA_AGENT });
 
 function serveFile(req, res, filePath) {
   fs.readFile(filePath, (err, data) => {
@@ -52,8 +59,8 @@ const server = http.createServer((req, res) => {
     return;
   }
   if (u.pathname.startsWith('/api/')) {
-    const target = OLLAMA + u.pathname.replace('/api', '/v1');
-    const options = url.parse(target);
+    const options = Object.assign({}, OLLAMA_TARGET);
+    options.path = OLLAMA_PATH + u.pathname.replace('/api', '/v1');
     options.method = req.method;
     options.headers = Object.assign({}, req.headers);
     const proxyReq = http.request(options, proxyRes => {